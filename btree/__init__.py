@@ -1,8 +1,43 @@
 """B-Tree data structure implementation."""
-import bisect
-from typing import Optional
+import sys
+from bisect import bisect_left, bisect_right, insort_left
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Type
+
+# A bulk operation rebuilds a subtree instead of applying its keys one at a
+# time once the batch covers at least 1 / _REBUILD_FRACTION of the subtree.
+# insert_many asks for a denser batch when nodes are small.
+_REBUILD_FRACTION = 4
+
+# search_many looks up a range of at most this many queries one at a time,
+# which is cheaper than splitting so few between a node's children.
+_SEARCH_ONE_BY_ONE = 16
 
 class BTreeNode:
+    # Nodes are numerous, so keep them free of a per-instance __dict__.
+    # ``min_degree`` and ``max_keys`` are class constants supplied by the
+    # per-degree subclass returned from :func:`_node_class`.
+    __slots__ = ('keys', 'children', 'is_leaf')
+
+    min_degree: int
+    max_keys: int
+
+    def __new__(cls, min_degree: int, is_leaf: bool) -> 'BTreeNode':
+        """
+        Create a node of the subclass specialised for ``min_degree``.
+
+        ``BTreeNode(min_degree, is_leaf)`` returns an instance of
+        ``_node_class(min_degree)``, so callers never see the subclass.
+
+        :raises ValueError: If called on a per-degree subclass with a
+            different ``min_degree``.
+        """
+        if cls is BTreeNode:
+            cls = _node_class(min_degree)
+        elif min_degree != cls.min_degree:
+            raise ValueError(f"{cls.__name__} requires min_degree {cls.min_degree}")
+        return super().__new__(cls)
+
     def __init__(self, min_degree: int, is_leaf: bool) -> None:
         """
         Initialize a B-Tree node.
@@ -11,31 +46,39 @@ class BTreeNode:
         :param is_leaf: Boolean, True if node is a leaf. Otherwise, False.
         """
         self.keys = []
-        self.min_degree = min_degree
         self.children = []
         self.is_leaf = is_leaf
 
+    def __reduce__(self):
+        """
+        Pickle through :class:`BTreeNode`, since the per-degree subclasses
+        are created at runtime and cannot be looked up by name.
+        """
+        state = {'keys': self.keys, 'children': self.children}
+        return BTreeNode, (self.min_degree, self.is_leaf), (None, state)
+
     def insert_non_full(self, key: int) -> None:
         """
         Insert a key into this non-full node using binary search.
         If the node is a leaf, it inserts the key directly.
         If the node is not a leaf, it finds the appropriate child to insert the key into.
-        If the child is full, it splits the child and then inserts the key.
-        This method maintains the B-Tree properties.
+        If the child is full, it splits the child before descending into it.
+        The descent is a single top-down loop, and maintains the B-Tree properties.
 
         :param key: The key to insert.
         :return: None
         """
-        if self.is_leaf:
-            key_index = self.get_key_index(key)
-            self.keys.insert(key_index, key)
-        else:
-            child_index = self.get_key_index(key)
-            if self.children[child_index].is_full():
-                self.split_child(child_index)
-                if key > self.keys[child_index]:
+        node = self
+        while not node.is_leaf:
+            child_index = bisect_left(node.keys, key)
+            if node.children[child_index].is_full():
+                node.split_child(child_index)
+                if key > node.keys[child_index]:
                     child_index += 1
-            self.children[child_index].insert_non_full(key)
+            node = node.children[child_index]
+
+        # Search and shift in a single C-level call
+        insort_left(node.keys, key)
 
     def is_full(self) -> bool:
         """
@@ -43,7 +86,7 @@ class BTreeNode:
 
         :return: True if node is full, False otherwise.
         """
-        return len(self.keys) == (2 * self.min_degree) - 1
+        return len(self.keys) == self.max_keys
 
     def split_child(self, child_index: int) -> None:
         """
@@ -54,17 +97,19 @@ class BTreeNode:
         """
         # make a new sibling node which will hold the right half of the keys
         existing_child = self.children[child_index]
-        new_child = BTreeNode(self.min_degree, existing_child.is_leaf)
+        new_child = type(existing_child)(self.min_degree, existing_child.is_leaf)
         
-        # Move the last min_degree - 1 keys from existing_child to new_child
-        middle_key = existing_child.keys[self.min_degree - 1]
-        new_child.keys = existing_child.keys[self.min_degree:]
-        existing_child.keys = existing_child.keys[:self.min_degree - 1]
+        # Move the last min_degree - 1 keys from existing_child to new_child,
+        # truncating existing_child in place rather than copying its head
+        min_degree = self.min_degree
+        middle_key = existing_child.keys[min_degree - 1]
+        new_child.keys = existing_child.keys[min_degree:]
+        del existing_child.keys[min_degree - 1:]
         
         # If existing_child is not a leaf, move the last min_degree children to new_child
         if not existing_child.is_leaf:
-            new_child.children = existing_child.children[self.min_degree:]
-            existing_child.children = existing_child.children[:self.min_degree]
+            new_child.children = existing_child.children[min_degree:]
+            del existing_child.children[min_degree:]
         
         # Insert the new child into the parent node
         self.children.insert(child_index + 1, new_child)
@@ -78,14 +123,29 @@ class BTreeNode:
 
         :return: None
         """
-        if self.is_leaf:
-            for key in self.keys:
-                print(key, end=' ')
-        else:
-            for i in range(len(self.keys)):
-                self.children[i].traverse()
-                print(self.keys[i], end=' ')
-            self.children[len(self.keys)].traverse()  # Last child traversal
+        # One write for the whole subtree instead of one print() per key
+        sys.stdout.write(''.join(f'{key} ' for key in self.iter_keys()))
+
+    def iter_keys(self) -> Iterator[int]:
+        """
+        Yield the keys of the subtree rooted at this node in order.
+
+        An explicit stack of ``(node, next_key_index)`` pairs replaces
+        recursion, so deep trees do not hit the interpreter recursion limit.
+
+        :return: Iterator over the keys in ascending order.
+        """
+        stack = [(self, 0)]
+        while stack:
+            node, idx = stack.pop()
+            if node.is_leaf:
+                yield from node.keys
+                continue
+            if idx > 0:
+                yield node.keys[idx - 1]
+            if idx < len(node.keys):
+                stack.append((node, idx + 1))
+            stack.append((node.children[idx], 0))
 
     def search(self, key: int) -> Optional['BTreeNode']:
         """
@@ -94,18 +154,18 @@ class BTreeNode:
         :param key: The key to search for.
         :return: Optional[BTreeNode] The node containing the key, or None if not found.
         """
-        if not self.keys:
-            return None
-
-        idx = self.get_key_index(key)
+        node = self
+        while True:
+            keys = node.keys
+            idx = bisect_left(keys, key)
 
-        if idx < len(self.keys) and self.keys[idx] == key:
-            return self  # Key found
+            if idx < len(keys) and keys[idx] == key:
+                return node  # Key found
 
-        if self.is_leaf:
-            return None  # Not found in leaf
+            if node.is_leaf:
+                return None  # Not found in leaf
 
-        return self.children[idx].search(key)  # Recurse into child
+            node = node.children[idx]  # Descend into child
 
     def get_key_index(self, key: int) -> int:
         """
@@ -114,7 +174,7 @@ class BTreeNode:
         :param key: The key to find.
         :return: Index of the key or where it should be.
         """
-        return bisect.bisect_left(self.keys, key)
+        return bisect_left(self.keys, key)
 
     def get_predecessor(self) -> int:
         """
@@ -198,17 +258,17 @@ class BTreeNode:
         :param idx: Index of the child to fill.
         :return: None
         """
-        if idx != 0 and len(self.children[idx - 1].keys) >= self.min_degree:
+        min_degree = self.min_degree
+        has_next = idx != len(self.keys)
+
+        if idx != 0 and len(self.children[idx - 1].keys) >= min_degree:
             self.borrow_from_prev(idx)
-        
-        elif idx != len(self.keys) and len(self.children[idx + 1].keys) >= self.min_degree:
+
+        elif has_next and len(self.children[idx + 1].keys) >= min_degree:
             self.borrow_from_next(idx)
-        
+
         else:
-            if idx != len(self.keys):
-                self.merge(idx)
-            else:
-                self.merge(idx - 1)
+            self.merge(idx if has_next else idx - 1)
 
     def remove_from_leaf(self, idx: int) -> None:
         """
@@ -226,62 +286,104 @@ class BTreeNode:
         :param idx: Index of the key to remove.
         :return: None
         """
+        child, key = self._replace_from_child(idx)
+        child._delete_internal(key)
+
+    def _replace_from_child(self, idx: int) -> Tuple['BTreeNode', int]:
+        """
+        Take the key at idx out of this non-leaf node.
+
+        The key is replaced by its predecessor or successor, or the two
+        children around it are merged. The caller must then delete the
+        returned key from the returned child.
+
+        :param idx: Index of the key to remove.
+        :return: The child to continue in and the key to delete from it.
+        """
         key = self.keys[idx]
-        
-        if len(self.children[idx].keys) >= self.min_degree:
-            pred = self.children[idx].get_predecessor()
+        child = self.children[idx]
+
+        if len(child.keys) >= self.min_degree:
+            pred = child.get_predecessor()
             self.keys[idx] = pred
-            self.children[idx]._delete_internal(pred)
-        
-        elif len(self.children[idx + 1].keys) >= self.min_degree:
-            succ = self.children[idx + 1].get_successor()
+            return child, pred
+
+        sibling = self.children[idx + 1]
+        if len(sibling.keys) >= self.min_degree:
+            succ = sibling.get_successor()
             self.keys[idx] = succ
-            self.children[idx + 1]._delete_internal(succ)
-        
-        else:
-            self.merge(idx)
-            self.children[idx]._delete_internal(key)
+            return sibling, succ
+
+        self.merge(idx)
+        return self.children[idx], key
 
     def _delete_internal(self, key: int) -> None:
         """
-        Recursively delete ``key`` from the subtree rooted at this node.
+        Delete ``key`` from the subtree rooted at this node.
 
-        This helper is called by :meth:`delete` after verifying that the
-        key exists. It implements the core B-Tree deletion algorithm.
+        This helper implements the core B-Tree deletion algorithm as a
+        single top-down loop rather than one call frame per level. If the
+        descent reaches a leaf without finding ``key`` it returns quietly.
 
-        :param key: Key guaranteed to exist in this subtree.
+        :param key: Key to delete.
         :return: None
         """
-        idx = self.get_key_index(key)
+        node = self
+        while True:
+            idx = bisect_left(node.keys, key)
 
-        if idx < len(self.keys) and self.keys[idx] == key:
-            if self.is_leaf:
-                self.remove_from_leaf(idx)
-            else:
-                self.remove_from_non_leaf(idx)
+            if idx < len(node.keys) and node.keys[idx] == key:
+                if node.is_leaf:
+                    node.remove_from_leaf(idx)
+                    return
+                node, key = node._replace_from_child(idx)
+                continue
 
-        else:
-            flag = (idx == len(self.keys))
+            if node.is_leaf:
+                return  # Key not present
 
-            if len(self.children[idx].keys) < self.min_degree:
-                self.fill(idx)
+            flag = (idx == len(node.keys))
+
+            if len(node.children[idx].keys) < node.min_degree:
+                node.fill(idx)
 
             # If the last child was merged, it may have moved
-            if flag and idx > len(self.keys):
-                self.children[idx - 1]._delete_internal(key)
+            if flag and idx > len(node.keys):
+                node = node.children[idx - 1]
             else:
-                self.children[idx]._delete_internal(key)
+                node = node.children[idx]
 
     def delete(self, key: int) -> None:
         """
         Delete ``key`` from the subtree rooted at this node.
 
-        ``search`` is used up-front so calls on non-existent keys exit early.
+        Non-existent keys are detected during the deletion descent itself,
+        so no separate ``search`` pass is made.
         """
-        if not self.search(key):
-            return
         self._delete_internal(key)
 
+
+@lru_cache(maxsize=None)
+def _node_class(min_degree: int) -> Type[BTreeNode]:
+    """
+    Return a :class:`BTreeNode` subclass specialised for ``min_degree``.
+
+    ``min_degree`` never changes for the lifetime of a tree, so it and the
+    node capacity are stored once as class constants: nodes do not carry
+    their own copy, and ``is_full`` avoids recomputing
+    ``2 * min_degree - 1`` on every check. Trees with the same degree share
+    one class.
+
+    :param min_degree: Minimum degree of the tree.
+    :return: The class that ``BTreeNode(min_degree, ...)`` instantiates.
+    """
+    return type(f'_BTreeNodeT{min_degree}', (BTreeNode,), {
+        'min_degree': min_degree,
+        'max_keys': 2 * min_degree - 1,
+        '__slots__': (),
+    })
+
+
 class BTree:
     def __init__(self, min_degree: int) -> None:
         """
@@ -296,6 +398,27 @@ class BTree:
         self.root = BTreeNode(min_degree, True)
         self.min_degree = min_degree
 
+    @classmethod
+    def build_from_sorted(cls, min_degree: int, keys: Iterable[int]) -> 'BTree':
+        """
+        Build a B-Tree from keys that are already in ascending order.
+
+        The tree is built top-down in a single O(N) pass, with no splits,
+        instead of inserting the keys one at a time. Keys are spread evenly
+        so nodes keep room for later inserts.
+
+        :param min_degree: Minimum degree (defines the range for number of keys)
+        :param keys: Keys in ascending order; duplicates are allowed.
+        :return: A new B-Tree holding ``keys``.
+        :raises ValueError: If ``min_degree`` is less than 2 or ``keys`` is not sorted.
+        """
+        tree = cls(min_degree)
+        keys = list(keys)
+        if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+            raise ValueError("keys must be sorted in ascending order")
+        tree.root = tree._build_root(keys)
+        return tree
+
     def traverse(self) -> None:
         """
         Traverse the entire B-Tree and print all keys in order.
@@ -315,6 +438,52 @@ class BTree:
             return None
         return self.root.search(key)
 
+    def search_many(self, keys: Iterable[int]) -> List[Optional[BTreeNode]]:
+        """
+        Search for several keys in the B-Tree in one descent.
+
+        The queries are sorted once and handed down the tree as contiguous
+        ranges, split at each node only by the separators inside the range,
+        so the upper levels are visited once per batch rather than once per
+        query. A range of at most ``_SEARCH_ONE_BY_ONE`` queries, including
+        a whole batch that small, is finished with :meth:`search` per query.
+
+        :param keys: The keys to search for, in any order.
+        :return: For each key, in input order, the node containing it or None.
+        """
+        queries = list(keys)
+        if len(queries) <= _SEARCH_ONE_BY_ONE:
+            return [self.search(key) for key in queries]
+        order = sorted(range(len(queries)), key=queries.__getitem__)
+        sorted_queries = [queries[i] for i in order]
+        results: List[Optional[BTreeNode]] = [None] * len(queries)
+
+        stack = [(self.root, 0, len(sorted_queries))]
+        while stack:
+            node, lo, hi = stack.pop()
+            if hi - lo <= _SEARCH_ONE_BY_ONE:
+                for pos in range(lo, hi):
+                    results[order[pos]] = node.search(sorted_queries[pos])
+                continue
+
+            # Only the separators inside the query range split it
+            first = bisect_left(node.keys, sorted_queries[lo])
+            last = bisect_right(node.keys, sorted_queries[hi - 1])
+            for idx in range(first, last + 1):
+                if idx < last:
+                    key = node.keys[idx]
+                    mid = bisect_left(sorted_queries, key, lo, hi)
+                    end = bisect_right(sorted_queries, key, mid, hi)
+                    for pos in range(mid, end):
+                        results[order[pos]] = node  # Key found
+                else:
+                    mid = end = hi
+                if not node.is_leaf and lo < mid:
+                    stack.append((node.children[idx], lo, mid))
+                lo = end
+
+        return results
+
     def insert(self, key: int) -> None:
         """
         Insert a new key into the B-Tree, handling root splits if necessary.
@@ -330,6 +499,32 @@ class BTree:
         
         self.root.insert_non_full(key)
 
+    def insert_many(self, keys: Iterable[int]) -> None:
+        """
+        Insert several keys into the B-Tree in one pass.
+
+        The sorted batch is pushed down the tree once: a leaf that can hold
+        its share takes it directly, and a subtree where the batch adds at
+        least one key for every ``min(4, min_degree / 2)`` already there
+        is rebuilt with the new keys merged in, so no node is split along
+        the way. Remaining keys go through :meth:`insert`. A batch sparser
+        than that over the range it spans is inserted key by key, so it
+        costs about the same as calling :meth:`insert` in a loop.
+
+        Nodes previously returned by :meth:`search` may be replaced.
+
+        :param keys: The keys to insert, in any order.
+        :return: None
+        """
+        pending = sorted(keys)
+        if not pending:
+            return
+        # Per-key inserts into small nodes are cheap next to a rebuild,
+        # which costs about the same per node whatever the degree.
+        fraction = min(_REBUILD_FRACTION, self.min_degree / 2)
+        for key in self._rebuild_touched(pending, _merge_sorted, fraction):
+            self.insert(key)
+
     def delete(self, key: int) -> None:
         """
         Delete a key from the B-Tree.
@@ -345,5 +540,298 @@ class BTree:
             self.root = self.root.children[0]
         # If the root is a leaf and has no keys, keep the empty root node
 
+    def delete_many(self, keys: Iterable[int]) -> None:
+        """
+        Delete several keys from the B-Tree in one pass.
+
+        Each occurrence in ``keys`` removes one matching key from the tree;
+        keys that are not present are ignored. The sorted batch is pushed
+        down the tree once: leaves that stay at least half full just drop
+        their keys, and any subtree where the batch hits at least one key
+        in four is rebuilt from its survivors, so neither borrows nor
+        merges after every removal. Remaining keys go through
+        :meth:`delete`, so a sparse batch costs about the same as calling
+        it in a loop.
+
+        Nodes previously returned by :meth:`search` may be replaced.
+
+        :param keys: The keys to delete, in any order.
+        :return: None
+        """
+        pending = sorted(keys)
+        if not pending:
+            return
+        for key in self._rebuild_touched(pending, _remove_sorted, _REBUILD_FRACTION):
+            self.delete(key)
+
+    def _rebuild_touched(self, pending: List[int],
+                         combine: Callable[[List[int], List[int]], List[int]],
+                         fraction: float) -> List[int]:
+        """
+        Apply a sorted batch to the subtrees it touches densely.
+
+        The batch is handed down the tree as contiguous ranges, as in
+        :meth:`search_many`. A leaf is rewritten with
+        ``combine(leaf_keys, batch_range)`` whenever the result still fits
+        in a node; a larger subtree is rebuilt from the combined keys when
+        the batch covers at least ``1 / fraction`` of it and the result fits
+        its height. While a range stays inside one child, the smallest
+        subtree on its path that qualifies is the one rebuilt. All other
+        subtrees are left untouched.
+
+        A batch that is sparse over the key range it spans is returned
+        whole without descending, since it could not rebuild anything.
+
+        :param pending: The batch, in ascending order.
+        :param combine: Merges a subtree's keys with its part of the batch.
+        :param fraction: Most keys a subtree may hold per key of the batch
+            and still be rebuilt.
+        :return: Keys that were not applied this way: a key that is alone
+            in its child subtree, equals a separator (and may sit on either
+            side of it), or falls in a leaf or subtree that cannot absorb it.
+        """
+        min_degree = self.min_degree
+        height = self._height()
+        low, low_slots = self._approx_position(pending[0])
+        high, high_slots = self._approx_position(pending[-1])
+        span = (high - low) * (low_slots * high_slots) ** 0.5
+        if len(pending) * fraction < span:
+            return pending
+
+        # Fewest and most keys a non-root subtree of each height can hold
+        bounds = [(min_degree ** (level + 1) - 1, (2 * min_degree) ** (level + 1) - 1)
+                  for level in range(height + 1)]
+
+        leftover = []
+        stack = [(None, 0, self.root, height, 0, len(pending))]
+        while stack:
+            parent, index, node, height, lo, hi = stack.pop()
+
+            # Follow the range down while it falls into a single child, then
+            # try the subtrees on that path from the smallest up: the first
+            # one that can absorb the range is the cheapest to rebuild.
+            path = [(parent, index, node, height)]
+            while height > 0:
+                idx = bisect_left(node.keys, pending[lo])
+                if idx < len(node.keys) and node.keys[idx] <= pending[hi - 1]:
+                    break
+                parent, index, node, height = node, idx, node.children[idx], height - 1
+                path.append((parent, index, node, height))
+
+            count = hi - lo
+            dense = count * fraction
+            rebuilt = False
+            for parent, index, node, height in reversed(path):
+                fewest, most = bounds[height]
+                size = len(node.keys)
+                if height > 0:
+                    if dense < fewest:
+                        break  # Every subtree further up is larger still
+                    size = _subtree_size(node, dense)
+                    if size > dense:
+                        break
+                if parent is None:
+                    self.root = self._build_root(
+                        combine(list(node.iter_keys()), pending[lo:hi]))
+                    rebuilt = True
+                    break
+                if size + count < fewest or size - count > most:
+                    continue  # Cannot fit this height whatever combine does
+                keys = combine(node.keys if height == 0 else list(node.iter_keys()),
+                               pending[lo:hi])
+                if fewest <= len(keys) <= most:
+                    if height == 0:
+                        node.keys = keys
+                    else:
+                        parent.children[index] = self._build_subtree(keys, 0, len(keys), height)
+                    rebuilt = True
+                    break
+            if rebuilt:
+                continue
+
+            parent, index, node, height = path[-1]
+            if height == 0:
+                leftover.extend(pending[lo:hi])
+                continue
+
+            # Only the separators inside the batch range split it. A key that
+            # ends up alone in a child is cheaper to apply directly than to
+            # follow down.
+            first = bisect_left(node.keys, pending[lo])
+            last = bisect_right(node.keys, pending[hi - 1])
+            for idx in range(first, last + 1):
+                if idx < last:
+                    key = node.keys[idx]
+                    mid = bisect_left(pending, key, lo, hi)
+                    end = bisect_right(pending, key, mid, hi)
+                else:
+                    mid = end = hi
+                if mid - lo > 1:
+                    stack.append((node, idx, node.children[idx], height - 1, lo, mid))
+                else:
+                    leftover.extend(pending[lo:mid])
+                leftover.extend(pending[mid:end])
+                lo = end
+
+        return leftover
+
+    def _build_root(self, keys: List[int]) -> BTreeNode:
+        """
+        Build a whole tree from sorted keys without any splits.
+
+        The tree gets the smallest height at which nodes average no more
+        than ``1.5 * min_degree`` children, so they keep room for later
+        inserts.
+
+        :param keys: Keys in ascending order.
+        :return: Root node of the new tree.
+        """
+        # A root with children takes at least 2 * min_degree ** height slots
+        slots = len(keys) + 1
+        height = 0
+        while (slots > (1.5 * self.min_degree) ** (height + 1)
+               and slots >= 2 * self.min_degree ** (height + 1)):
+            height += 1
+        return self._build_subtree(keys, 0, len(keys), height, is_root=True)
+
+    def _build_subtree(self, keys: List[int], lo: int, hi: int, height: int,
+                       is_root: bool = False) -> BTreeNode:
+        """
+        Build a subtree of exactly ``height`` from ``keys[lo:hi]``.
+
+        The caller guarantees the count fits: at most
+        ``(2 * min_degree) ** (height + 1) - 1`` keys, and at least
+        ``min_degree ** (height + 1) - 1`` unless ``is_root``. Every level
+        gets about the same fan-out, so nodes end up equally full instead
+        of the leaves being left at the minimum.
+
+        :param keys: Keys in ascending order.
+        :param lo: Start of the range to build from.
+        :param hi: End (exclusive) of the range to build from.
+        :param height: Levels below the new node (0 for a leaf).
+        :param is_root: True if the node is the root of the whole tree,
+            which may have as few as two children.
+        :return: Root node of the new subtree.
+        """
+        node = BTreeNode(self.min_degree, height == 0)
+        if height == 0:
+            node.keys = keys[lo:hi]
+            return node
+
+        # A child subtree holding s keys takes s + 1 slots, and a subtree of
+        # this height takes between min_degree ** height and
+        # (2 * min_degree) ** height slots.
+        slots = hi - lo + 1
+        fewest = max(2 if is_root else self.min_degree,
+                     -(-slots // (2 * self.min_degree) ** height))
+        most = min(2 * self.min_degree, slots // self.min_degree ** height)
+        n_children = min(most, max(fewest, int(slots ** (1 / (height + 1)) + 1e-9)))
+        base, extra = divmod(slots, n_children)
+
+        pos = lo
+        for i in range(n_children):
+            size = base + (i < extra) - 1
+            node.children.append(self._build_subtree(keys, pos, pos + size, height - 1))
+            pos += size
+            if pos < hi:
+                node.keys.append(keys[pos])
+                pos += 1
+        return node
+
+    def _approx_position(self, key: int) -> Tuple[float, int]:
+        """
+        Estimate where ``key`` falls in the tree, without counting keys.
+
+        Each node on the search path splits its share of the tree evenly
+        between its children, so the position is a fraction that grows
+        with ``key``. Multiplying the fan-outs along the same path gives a
+        rough size of the tree to scale it by.
+
+        :param key: The key to place.
+        :return: Fraction of the keys that are smaller than ``key``, and
+            the estimated number of keys plus one.
+        """
+        fraction = 0.0
+        share = 1.0
+        slots = 1
+        node = self.root
+        while True:
+            idx = bisect_left(node.keys, key)
+            share /= len(node.keys) + 1
+            fraction += idx * share
+            slots *= len(node.keys) + 1
+            if node.is_leaf:
+                return fraction, slots
+            node = node.children[idx]
+
+    def _height(self) -> int:
+        """
+        Number of levels below the root (0 when the root is a leaf).
+
+        :return: Height of the tree.
+        """
+        height = 0
+        node = self.root
+        while not node.is_leaf:
+            node = node.children[0]
+            height += 1
+        return height
+
+
+def _subtree_size(node: BTreeNode, limit: float) -> int:
+    """
+    Count the keys in the subtree rooted at ``node``, up to ``limit``.
+
+    Counting stops as soon as the total exceeds ``limit``, so callers that
+    only compare the size with ``limit`` pay for at most that many keys.
+
+    :param node: Root of the subtree.
+    :param limit: Count beyond which the exact size does not matter.
+    :return: Number of keys, or some number above ``limit`` if the subtree
+        is larger. Keys are counted per node rather than per key.
+    """
+    size = 0
+    stack = [node]
+    while stack and size <= limit:
+        node = stack.pop()
+        size += len(node.keys)
+        stack.extend(node.children)
+    return size
+
+
+def _remove_sorted(keys: List[int], removals: List[int]) -> List[int]:
+    """
+    Drop one occurrence of each of ``removals`` from ``keys``.
+
+    Each removal is found with ``bisect`` and the runs of survivors between
+    them are copied as slices, so there is no Python loop over ``keys``.
+
+    :param keys: Keys in ascending order; not modified.
+    :param removals: Keys to drop, in ascending order; missing ones are ignored.
+    :return: The remaining keys, in ascending order.
+    """
+    survivors = []
+    start = 0
+    for key in removals:
+        idx = bisect_left(keys, key, start)
+        if idx < len(keys) and keys[idx] == key:
+            survivors += keys[start:idx]
+            start = idx + 1
+    survivors += keys[start:]
+    return survivors
+
+
+def _merge_sorted(keys: List[int], additions: List[int]) -> List[int]:
+    """
+    Merge ``additions`` into ``keys``.
+
+    ``sorted`` finds the two ascending runs and merges them in linear time.
+
+    :param keys: Keys in ascending order; not modified.
+    :param additions: Keys to add, in ascending order.
+    :return: All keys, in ascending order.
+    """
+    return sorted(keys + additions)
+
 
 __all__ = ['BTree', 'BTreeNode']
@@ -1,8 +1,9 @@
 import unittest
 from io import StringIO
 from contextlib import redirect_stdout
+import pickle
 import sys
-from btree import BTree
+from btree import BTree, BTreeNode
 
 class TestBTree(unittest.TestCase):
     """Unit tests for the BTree class."""
@@ -13,6 +14,31 @@ class TestBTree(unittest.TestCase):
         for key in [10, 20, 5, 6, 12, 30, 7, 17]:
             self.btree.insert(key)
 
+    def assert_valid(self, tree):
+        """Assert the B-Tree invariants hold for every node of ``tree``."""
+        min_degree = tree.min_degree
+        leaf_depths = set()
+        stack = [(tree.root, 0, None, None)]
+        while stack:
+            node, depth, low, high = stack.pop()
+            self.assertLessEqual(len(node.keys), 2 * min_degree - 1)
+            if node is not tree.root:
+                self.assertGreaterEqual(len(node.keys), min_degree - 1)
+            self.assertEqual(node.keys, sorted(node.keys))
+            if node.keys:
+                self.assertTrue(low is None or low <= node.keys[0])
+                self.assertTrue(high is None or node.keys[-1] <= high)
+            if node.is_leaf:
+                self.assertEqual(node.children, [])
+                leaf_depths.add(depth)
+                continue
+            self.assertGreater(len(node.keys), 0)
+            self.assertEqual(len(node.children), len(node.keys) + 1)
+            bounds = [low] + node.keys + [high]
+            for idx, child in enumerate(node.children):
+                stack.append((child, depth + 1, bounds[idx], bounds[idx + 1]))
+        self.assertEqual(len(leaf_depths), 1)
+
     def test_insert_and_traverse(self):
         """Test in-order traversal after multiple insertions."""
         captured_output = StringIO()
@@ -126,5 +152,170 @@ class TestBTree(unittest.TestCase):
             split_tree.traverse()
         self.assertEqual(captured_output.getvalue().strip(), "1 2 3 4")
 
+    def test_iter_keys_after_deletions(self):
+        """In-order iteration over a multi-level tree should stay correct after deletions."""
+        deep_tree = BTree(2)
+        keys = list(range(2000, 0, -1))
+        for key in keys:
+            deep_tree.insert(key)
+        self.assertEqual(list(deep_tree.root.iter_keys()), sorted(keys))
+        for key in keys[::2]:
+            deep_tree.delete(key)
+        self.assertEqual(list(deep_tree.root.iter_keys()), sorted(keys[1::2]))
+
+    def test_delete_many(self):
+        """Bulk deletion should remove listed keys and ignore missing ones."""
+        self.btree.delete_many([30, 6, 999, 10])
+        self.assert_valid(self.btree)
+        self.assertEqual(list(self.btree.root.iter_keys()), [5, 7, 12, 17, 20])
+        for key in [6, 10, 30]:
+            self.assertIsNone(self.btree.search(key))
+        self.btree.insert(6)
+        self.assertIsNotNone(self.btree.search(6))
+
+    def test_build_from_sorted(self):
+        """Bulk loading sorted keys should round-trip through traversal."""
+        keys = list(range(0, 500, 3))
+        built_tree = BTree.build_from_sorted(3, keys)
+        captured_output = StringIO()
+        with redirect_stdout(captured_output):
+            built_tree.traverse()
+        self.assertEqual(captured_output.getvalue().split(), [str(key) for key in keys])
+        self.assertIsNotNone(built_tree.search(99))
+        self.assertIsNone(built_tree.search(100))
+        built_tree.insert(100)
+        built_tree.delete(99)
+        self.assertIsNotNone(built_tree.search(100))
+        self.assertIsNone(built_tree.search(99))
+
+    def test_build_from_unsorted_keys(self):
+        """Bulk loading unsorted keys should raise ``ValueError``."""
+        with self.assertRaises(ValueError):
+            BTree.build_from_sorted(3, [3, 1, 2])
+
+    def test_search_many(self):
+        """Batched search should match individual searches in input order."""
+        queries = [30, 100, 5, 6, 6, -1, 17, 11]
+        results = self.btree.search_many(queries)
+        self.assertEqual(results, [self.btree.search(key) for key in queries])
+        self.assertEqual([result is not None for result in results],
+                         [True, False, True, True, True, False, True, False])
+        self.assertEqual(BTree(2).search_many([1, 2]), [None, None])
+
+        large_tree = BTree.build_from_sorted(2, range(0, 3000, 3))
+        queries = list(range(3100, -100, -7)) + [30, 30, 2999]
+        results = large_tree.search_many(queries)
+        self.assertEqual(results, [large_tree.search(key) for key in queries])
+        self.assertEqual([result is not None for result in results],
+                         [0 <= key < 3000 and key % 3 == 0 for key in queries])
+
+    def test_insert_many(self):
+        """Bulk insertion should merge unsorted keys into the existing tree."""
+        self.btree.insert_many([25, 1, 12, 40])
+        self.assert_valid(self.btree)
+        self.assertEqual(list(self.btree.root.iter_keys()),
+                         [1, 5, 6, 7, 10, 12, 12, 17, 20, 25, 30, 40])
+        for key in [1, 25, 40]:
+            self.assertIsNotNone(self.btree.search(key))
+
+        small_tree = BTree(2)
+        for key in [10, 20, 5, 6, 12, 30, 7, 17]:
+            small_tree.insert(key)
+        small_tree.insert_many([25, 1, 12, 40, 8, 9])
+        self.assert_valid(small_tree)
+        self.assertEqual(list(small_tree.root.iter_keys()),
+                         [1, 5, 6, 7, 8, 9, 10, 12, 12, 17, 20, 25, 30, 40])
+
+    def test_node_constructed_directly(self):
+        """A node built with ``BTreeNode(min_degree, is_leaf)`` should be usable."""
+        node = BTreeNode(2, True)
+        for key in [3, 1, 2]:
+            node.insert_non_full(key)
+        self.assertEqual(node.keys, [1, 2, 3])
+        self.assertTrue(node.is_full())
+        self.assertIs(node.search(2), node)
+
+    def test_pickle_round_trip(self):
+        """A pickled tree should restore with the same keys and stay usable."""
+        for key in [1, 2, 3, 4, 8, 9]:
+            self.btree.insert(key)
+        restored = pickle.loads(pickle.dumps(self.btree))
+        self.assertEqual(list(restored.root.iter_keys()), list(self.btree.root.iter_keys()))
+        self.assertEqual(restored.root.max_keys, 5)
+        restored.insert(11)
+        restored.delete(10)
+        self.assertIsNotNone(restored.search(11))
+        self.assertIsNone(restored.search(10))
+
+    def test_delete_many_large_batches(self):
+        """Dense and sparse bulk deletions should match per-key deletion."""
+        for min_degree in (2, 3):
+            with self.subTest(min_degree=min_degree):
+                keys = list(range(20000))
+                large_tree = BTree.build_from_sorted(min_degree, keys)
+                untouched = large_tree.search(19000)
+                batches = [list(range(400, 900)), list(range(0, 20000, 97)),
+                           list(range(1000, 2000, 2))]
+                for batch in batches:
+                    large_tree.delete_many(batch)
+                    self.assert_valid(large_tree)
+                    removed = set(batch)
+                    keys = [key for key in keys if key not in removed]
+                    self.assertEqual(list(large_tree.root.iter_keys()), keys)
+                self.assertIs(large_tree.search(19000), untouched)
+                for key in [401, 1000, 1001, 19999]:
+                    large_tree.insert(key)
+                self.assert_valid(large_tree)
+                self.assertEqual(list(large_tree.root.iter_keys()),
+                                 sorted(keys + [401, 1000, 1001, 19999]))
+
+    def test_delete_many_clustered(self):
+        """Deleting long runs of neighbouring keys should stay balanced."""
+        keys = list(range(30000))
+        clustered_tree = BTree.build_from_sorted(2, keys)
+        for batch in [list(range(10000, 20000)), list(range(25000, 30000))]:
+            clustered_tree.delete_many(batch[::-1])
+            self.assert_valid(clustered_tree)
+            removed = set(batch)
+            keys = [key for key in keys if key not in removed]
+            self.assertEqual(list(clustered_tree.root.iter_keys()), keys)
+
+    def test_insert_many_large_batches(self):
+        """Dense and sparse bulk insertions should match per-key insertion."""
+        for min_degree in (2, 3):
+            with self.subTest(min_degree=min_degree):
+                keys = list(range(0, 40000, 2))
+                large_tree = BTree.build_from_sorted(min_degree, keys)
+                untouched = large_tree.search(39000)
+                batches = [list(range(1001, 3001, 2)), [5, 20001, 30001],
+                           list(range(0, 40000, 50))]
+                for batch in batches[:2]:
+                    large_tree.insert_many(batch)
+                    self.assert_valid(large_tree)
+                    keys = sorted(keys + batch)
+                    self.assertEqual(list(large_tree.root.iter_keys()), keys)
+                self.assertIs(large_tree.search(39000), untouched)
+                large_tree.insert_many(batches[2])
+                self.assert_valid(large_tree)
+                keys = sorted(keys + batches[2])
+                self.assertEqual(list(large_tree.root.iter_keys()), keys)
+
+    def test_insert_many_clustered(self):
+        """Batches packed into one gap or past the end should stay balanced."""
+        keys = list(range(10000)) + list(range(20000, 30000))
+        clustered_tree = BTree.build_from_sorted(2, keys)
+        for batch in [list(range(10000, 20000)), list(range(30000, 35000))]:
+            clustered_tree.insert_many(batch[::-1])
+            self.assert_valid(clustered_tree)
+            keys = sorted(keys + batch)
+            self.assertEqual(list(clustered_tree.root.iter_keys()), keys)
+
+    def test_delete_many_all_keys(self):
+        """Bulk deleting every key should leave an empty leaf root."""
+        self.btree.delete_many([5, 6, 7, 10, 12, 17, 20, 30])
+        self.assert_valid(self.btree)
+        self.assertTrue(self.btree.root.is_leaf)
+        self.assertEqual(len(self.btree.root.keys), 0)
+
 if __name__ == '__main__':
     unittest.main()